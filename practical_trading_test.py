@@ -6,6 +6,7 @@ Demonstrates core trading algorithms without quantum dependencies
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime, timedelta
 import sys
 import os
@@ -34,10 +35,11 @@ def test_classical_trading_algorithms():
         signals['price'] = prices
         signals['short_ma'] = prices.rolling(window=short_window).mean()
         signals['long_ma'] = prices.rolling(window=long_window).mean()
-        signals['signal'] = 0.0
-        signals['signal'][short_window:] = np.where(
-            signals['short_ma'][short_window:] > signals['long_ma'][short_window:], 1.0, 0.0
+        signal = np.where(
+            signals['short_ma'].to_numpy() > signals['long_ma'].to_numpy(), 1.0, 0.0
         )
+        signal[:short_window] = 0.0
+        signals['signal'] = signal
         signals['positions'] = signals['signal'].diff()
         return signals
     
@@ -106,13 +108,11 @@ def test_ai_prediction_simulation():
     historical_prices = np.random.normal(100, 15, 252)  # 1 year of daily data
     
     def simple_lstm_simulation(prices, sequence_length=10):
-        predictions = []
-        for i in range(sequence_length, len(prices)):
-            sequence = prices[i-sequence_length:i]
-            # Simple neural network simulation
-            prediction = np.mean(sequence) + 0.1 * np.mean(np.diff(sequence))
-            predictions.append(prediction)
-        return np.array(predictions)
+        # Each prediction sees the window ending just before its target day
+        windows = sliding_window_view(prices, sequence_length)[:-1]
+        # Simple neural network simulation; mean(diff(w)) == (w[-1] - w[0]) / (n - 1)
+        trend = (windows[:, -1] - windows[:, 0]) / (sequence_length - 1)
+        return windows.mean(axis=1) + 0.1 * trend
     
     # Generate predictions
     predictions = simple_lstm_simulation(historical_prices)
@@ -148,10 +148,10 @@ def test_risk_management():
     
     # Calculate Maximum Drawdown
     def calculate_max_drawdown(returns):
-        cumulative_returns = np.cumprod(1 + returns)
-        rolling_max = np.maximum.accumulate(cumulative_returns)
-        drawdowns = (cumulative_returns - rolling_max) / rolling_max
-        return np.min(drawdowns)
+        # Work in log space so long histories cannot overflow cumprod
+        log_cumulative = np.cumsum(np.log1p(returns))
+        log_drawdowns = log_cumulative - np.maximum.accumulate(log_cumulative)
+        return np.expm1(log_drawdowns.min())
     
     print("✅ Risk Metrics Calculation:")
     var_5pct = calculate_var(portfolio_returns, 0.05)